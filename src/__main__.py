@@ -1,36 +1,33 @@
 """Main entry point for the Daily Excel Reports application."""
 
-import argparse
 import sys
 
-from src.cli import main as cli_main
-from src.web import main as web_main
+_MODES = ("cli", "web")
 
 
 def main() -> None:
-    """Main entry point for the application."""
-    parser = argparse.ArgumentParser(
-        description="Daily Excel Reports - Process Excel and CSV files",
-    )
-
-    # Define the main subcommand argument
-    parser.add_argument(
-        "mode",
-        choices=["cli", "web"],
-        default="cli",
-        nargs="?",
-        help="Run mode: command line (cli) or web interface (web)",
-    )
-
-    # Parse only the first argument to determine mode
-    args, remaining_args = parser.parse_known_args()
-
-    if args.mode == "web":
+    """Main entry point for the application.
+
+    The run mode is taken from the first argument (``cli`` or ``web``,
+    defaulting to ``cli``) and only the selected interface is imported, so
+    command line runs do not pay for loading the web stack.
+    """
+    argv = sys.argv[1:]
+    mode = "cli"
+    if argv and argv[0] in _MODES:
+        mode, argv = argv[0], argv[1:]
+
+    if mode == "web":
         # Run web interface
+        from src.web import main as web_main
+
         web_main()
         return 0
+
     # Run CLI interface
-    return cli_main(remaining_args)
+    from src.cli import main as cli_main
+
+    return cli_main(argv)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import logging
 import argparse
 from typing import List
 
@@ -12,6 +13,15 @@ from .utils.exceptions import BaseError
 
 logger = get_logger(__name__)
 
+# Map of --log-level choices to logging levels
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 def parse_arguments(args: List[str] = None):
     """Parse command-line arguments.
@@ -51,7 +61,7 @@ def parse_arguments(args: List[str] = None):
 
     parser.add_argument(
         "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=list(_LOG_LEVELS),
         default="INFO",
         help="Logging level",
     )
@@ -75,9 +85,7 @@ def main(args: List[str] = None):
         parsed_args = parse_arguments(args)
 
         # Configure logging
-        import logging
-
-        log_level = getattr(logging, parsed_args.log_level)
+        log_level = _LOG_LEVELS[parsed_args.log_level]
         configure_logging(parsed_args.log_dir, console_level=log_level)
 
         logger.info("Starting Daily Excel Reports")
@@ -1,17 +1,88 @@
 """Export module for saving processed data to files."""
 
+import asyncio
+import codecs
+import functools
+import io
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
 
+import openpyxl
 import pandas as pd
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
 
 from src.utils.exceptions import ExportError
 from src.utils.logging import get_logger
 
+try:
+    from rustpy_xlsxwriter import FastExcel
+except ImportError:  # pragma: no cover - optional dependency
+    FastExcel = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pa_csv = None
+
 logger = get_logger(__name__)
 
+# Header styles are built once and shared by every formatted sheet
+_HEADER_STYLE_NAME = "DailyReportHeader"
+_HEADER_FONT = Font(bold=True)
+_HEADER_FILL = PatternFill(
+    start_color="D9E1F2",
+    end_color="D9E1F2",
+    fill_type="solid",
+)
+_THIN_SIDE = Side(style="thin")
+_THIN_BORDER = Border(
+    left=_THIN_SIDE,
+    right=_THIN_SIDE,
+    top=_THIN_SIDE,
+    bottom=_THIN_SIDE,
+)
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+
+
+def _use_fast_writer(*, fast: bool, formatting_func: Callable | None) -> bool:
+    """Check whether the Rust-backed writer can be used for an export.
+
+    Args:
+        fast: Whether the caller allows the fast writer
+        formatting_func: Formatting callback, which requires openpyxl
+
+    Returns:
+        True if the export should go through FastExcel
+    """
+    return fast and formatting_func is None and FastExcel is not None
+
+
+def _non_empty_sheets(
+    dataframes: dict[str, pd.DataFrame],
+) -> dict[str, pd.DataFrame]:
+    """Select the sheets that have data to write.
+
+    Args:
+        dataframes: Dictionary mapping sheet names to DataFrames
+
+    Returns:
+        Dictionary with non-DataFrame and empty entries removed
+    """
+    sheets = {}
+    for sheet_name, sheet_data in dataframes.items():
+        if not isinstance(sheet_data, pd.DataFrame):
+            logger.warning("Skipping sheet %s: not a DataFrame", sheet_name)
+        elif sheet_data.empty:
+            logger.info("Skipping empty sheet %s", sheet_name)
+        else:
+            sheets[sheet_name] = sheet_data
+    return sheets
+
 
 class Exporter:
     """Base class for data exporters."""
@@ -42,17 +113,22 @@ class ExcelExporter(Exporter):
     def __init__(
         self,
         sheet_name: str = "Data",
-        formatting_func: Callable[[pd.DataFrame, str], None] | None = None,
+        formatting_func: Callable[[any, str, pd.DataFrame], None] | None = None,
+        *,
+        fast: bool = True,
     ) -> None:
         """Initialize Excel exporter.
 
         Args:
             sheet_name: Name of the sheet to create
-            formatting_func: Optional function to apply Excel formatting
+            formatting_func: Optional function to apply Excel formatting,
+                called with the writer, sheet name and exported DataFrame
+            fast: Use the Rust-backed writer when no formatting is requested
         """
         super().__init__()
         self.sheet_name = sheet_name
         self.formatting_func = formatting_func
+        self.fast = fast
 
     def export(self, data_frame: pd.DataFrame, output_path: str) -> str:
         """Export DataFrame to Excel file.
@@ -62,35 +138,70 @@ class ExcelExporter(Exporter):
             output_path: Path to save the Excel file
 
         Returns:
-            Path to the exported file
+            Path to the exported file; nothing is written for an empty
+            DataFrame
 
         Raises:
             ExportError: If the data cannot be exported
         """
+        if data_frame.empty:
+            logger.info("Skipping empty export for %s", output_path)
+            return output_path
+
         try:
             # Ensure the directory exists
             output_path_obj = Path(output_path)
             output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-            msg = f"Exporting {len(data_frame)} rows to {output_path}"
-            logger.info(msg)
+            logger.info("Exporting %d rows to %s", len(data_frame), output_path)
+            self._write(data_frame, output_path)
+            logger.info("Successfully exported data to %s", output_path)
+            return output_path
 
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                data_frame.to_excel(writer, sheet_name=self.sheet_name, index=False)
+        except Exception as e:
+            error_msg = f"Failed to export data to {output_path}: {e}"
+            logger.exception(error_msg)
+            raise ExportError(error_msg) from e
 
-                if self.formatting_func:
-                    msg = f"Applying formatting to sheet {self.sheet_name}"
-                    logger.debug(msg)
-                    self.formatting_func(writer, self.sheet_name)
+    def render(self, data_frame: pd.DataFrame) -> bytes:
+        """Serialize a DataFrame to the bytes of an Excel workbook.
 
-            logger.info(f"Successfully exported data to {output_path}")
-            return output_path
+        Args:
+            data_frame: DataFrame to export
 
+        Returns:
+            Contents of the .xlsx file
+
+        Raises:
+            ExportError: If the data cannot be serialized
+        """
+        try:
+            buffer = io.BytesIO()
+            self._write(data_frame, buffer)
+            return buffer.getvalue()
         except Exception as e:
-            error_msg = f"Failed to export data to {output_path}: {e}"
+            error_msg = f"Failed to render workbook: {e}"
             logger.exception(error_msg)
             raise ExportError(error_msg) from e
 
+    def _write(self, data_frame: pd.DataFrame, target: str | io.BytesIO) -> None:
+        """Write the DataFrame as a workbook to a path or binary buffer.
+
+        Args:
+            data_frame: DataFrame to export
+            target: File path or writable binary buffer
+        """
+        if _use_fast_writer(fast=self.fast, formatting_func=self.formatting_func):
+            FastExcel(target, autofit=True).sheet(self.sheet_name, data_frame).save()
+            return
+
+        with pd.ExcelWriter(target, engine="openpyxl") as writer:
+            data_frame.to_excel(writer, sheet_name=self.sheet_name, index=False)
+
+            if self.formatting_func:
+                logger.debug("Applying formatting to sheet %s", self.sheet_name)
+                self.formatting_func(writer, self.sheet_name, data_frame)
+
 
 class CSVExporter(Exporter):
     """Exporter for CSV files."""
@@ -124,14 +235,15 @@ class CSVExporter(Exporter):
             output_path_obj = Path(output_path)
             output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-            logger.info(f"Exporting {len(data_frame)} rows to {output_path}")
-            data_frame.to_csv(
-                output_path,
-                index=False,
-                delimiter=self.delimiter,
-                encoding=self.encoding,
-            )
-            logger.info(f"Successfully exported data to {output_path}")
+            logger.info("Exporting %d rows to %s", len(data_frame), output_path)
+            if not self._export_arrow(data_frame, output_path):
+                data_frame.to_csv(
+                    output_path,
+                    index=False,
+                    sep=self.delimiter,
+                    encoding=self.encoding,
+                )
+            logger.info("Successfully exported data to %s", output_path)
             return output_path
 
         except Exception as e:
@@ -139,21 +251,55 @@ class CSVExporter(Exporter):
             logger.exception(error_msg)
             raise ExportError(error_msg) from e
 
+    def _export_arrow(self, data_frame: pd.DataFrame, output_path: str) -> bool:
+        """Write the DataFrame with PyArrow's multithreaded CSV writer.
+
+        Arrow always writes UTF-8, so other encodings and frames Arrow
+        cannot convert are left to pandas.
+
+        Args:
+            data_frame: DataFrame to export
+            output_path: Path to save the CSV file
+
+        Returns:
+            True if the file was written, False if pandas should be used
+        """
+        if pa_csv is None or codecs.lookup(self.encoding).name != "utf-8":
+            return False
+
+        try:
+            table = pa.Table.from_pandas(data_frame, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            logger.debug("Falling back to pandas CSV writer for mixed-type data")
+            return False
+
+        pa_csv.write_csv(
+            table,
+            output_path,
+            write_options=pa_csv.WriteOptions(delimiter=self.delimiter),
+        )
+        return True
+
 
 class MultiSheetExcelExporter(Exporter):
     """Exporter for multi-sheet Excel files."""
 
     def __init__(
         self,
-        formatting_func: Callable[[pd.DataFrame, str], None] | None = None,
+        formatting_func: Callable[[any, str, pd.DataFrame], None] | None = None,
+        *,
+        fast: bool = True,
     ) -> None:
         """Initialize multi-sheet Excel exporter.
 
         Args:
-            formatting_func: Optional function to apply Excel formatting
+            formatting_func: Optional function to apply Excel formatting,
+                called with the writer, sheet name and exported DataFrame
+            fast: Use the Rust-backed writer when no formatting is requested
         """
         super().__init__()
         self.formatting_func = formatting_func
+        self.fast = fast
 
     def export_multiple(
         self,
@@ -167,41 +313,35 @@ class MultiSheetExcelExporter(Exporter):
             output_path: Path to save the Excel file
 
         Returns:
-            Path to the exported file
+            Path to the exported file; nothing is written when every
+            DataFrame is empty
 
         Raises:
             ExportError: If the data cannot be exported
         """
+        sheets = _non_empty_sheets(dataframes)
+        if not sheets:
+            logger.info("Skipping empty export for %s", output_path)
+            return output_path
+
         try:
             # Ensure the directory exists
             output_path_obj = Path(output_path)
             output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-            logger.info(
-                f"Exporting {len(dataframes)} sheets to {output_path}",
-            )
+            logger.info("Exporting %d sheets to %s", len(sheets), output_path)
 
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                for sheet_name, sheet_data in dataframes.items():
-                    if not isinstance(sheet_data, pd.DataFrame):
-                        logger.warning(
-                            f"Skipping sheet {sheet_name}: not a DataFrame",
-                        )
-                        continue
-
-                    logger.debug(
-                        f"Adding sheet {sheet_name} with {len(sheet_data)} rows",
-                    )
-                    sheet_data.to_excel(writer, sheet_name=sheet_name, index=False)
-
-                    if self.formatting_func:
-                        logger.debug(
-                            f"Applying formatting to sheet {sheet_name}",
-                        )
-                        self.formatting_func(writer, sheet_name)
+            if _use_fast_writer(fast=self.fast, formatting_func=self.formatting_func):
+                self._export_fast(sheets, output_path)
+            elif self.formatting_func is None:
+                self._export_write_only(sheets, output_path)
+            else:
+                self._export_openpyxl(sheets, output_path)
 
             logger.info(
-                f"Successfully exported {len(dataframes)} sheets to {output_path}",
+                "Successfully exported %d sheets to %s",
+                len(sheets),
+                output_path,
             )
             return output_path
 
@@ -210,6 +350,127 @@ class MultiSheetExcelExporter(Exporter):
             logger.exception(error_msg)
             raise ExportError(error_msg) from e
 
+    def _export_fast(
+        self,
+        dataframes: dict[str, pd.DataFrame],
+        output_path: str,
+    ) -> None:
+        """Write all sheets with the Rust-backed FastExcel writer.
+
+        Args:
+            dataframes: Dictionary mapping sheet names to DataFrames
+            output_path: Path to save the Excel file
+        """
+        workbook = FastExcel(output_path, autofit=True)
+        for sheet_name, sheet_data in dataframes.items():
+            logger.debug("Adding sheet %s with %d rows", sheet_name, len(sheet_data))
+            workbook.sheet(sheet_name, sheet_data)
+        workbook.save()
+
+    def _export_write_only(
+        self,
+        dataframes: dict[str, pd.DataFrame],
+        output_path: str,
+    ) -> None:
+        """Stream all sheets into a write-only openpyxl workbook.
+
+        Rows are appended as plain tuples, so no ``Cell`` object is kept per
+        value. Write-only sheets cannot be styled afterwards, which is why
+        this path is only used when no formatting is requested.
+
+        Args:
+            dataframes: Dictionary mapping sheet names to DataFrames
+            output_path: Path to save the Excel file
+        """
+        workbook = openpyxl.Workbook(write_only=True)
+        for sheet_name, sheet_data in dataframes.items():
+            logger.debug("Adding sheet %s with %d rows", sheet_name, len(sheet_data))
+            worksheet = workbook.create_sheet(sheet_name)
+            worksheet.append([str(column) for column in sheet_data.columns])
+            values = sheet_data.astype(object).where(sheet_data.notna(), None)
+            for row in values.itertuples(index=False, name=None):
+                worksheet.append(row)
+        workbook.save(output_path)
+
+    def _export_openpyxl(
+        self,
+        dataframes: dict[str, pd.DataFrame],
+        output_path: str,
+    ) -> None:
+        """Write all sheets through pandas and openpyxl.
+
+        Args:
+            dataframes: Dictionary mapping sheet names to DataFrames
+            output_path: Path to save the Excel file
+        """
+        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+            for sheet_name, sheet_data in dataframes.items():
+                logger.debug(
+                    "Adding sheet %s with %d rows",
+                    sheet_name,
+                    len(sheet_data),
+                )
+                sheet_data.to_excel(writer, sheet_name=sheet_name, index=False)
+
+                if self.formatting_func:
+                    logger.debug("Applying formatting to sheet %s", sheet_name)
+                    self.formatting_func(writer, sheet_name, sheet_data)
+
+    def export_separate(
+        self,
+        dataframes: dict[str, pd.DataFrame],
+        output_path: str,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Export each DataFrame to its own workbook in parallel processes.
+
+        Workbook serialization is CPU-bound and holds the GIL, so sheets are
+        written by separate processes. Each sheet goes to
+        ``<stem>_<sheet_name><suffix>`` next to ``output_path``.
+
+        Args:
+            dataframes: Dictionary mapping sheet names to DataFrames
+            output_path: Path used to derive the per-sheet file names
+            max_workers: Maximum number of worker processes
+
+        Returns:
+            List of paths to the exported files, in sheet order
+
+        Raises:
+            ExportError: If any sheet cannot be exported
+        """
+        output_path_obj = Path(output_path)
+        jobs = {}
+        for sheet_name, sheet_data in _non_empty_sheets(dataframes).items():
+            sheet_path = output_path_obj.with_name(
+                f"{output_path_obj.stem}_{sheet_name}{output_path_obj.suffix}",
+            )
+            jobs[sheet_name] = (sheet_data, str(sheet_path))
+
+        logger.info("Exporting %d sheets to separate files", len(jobs))
+
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _export_sheet_worker,
+                        (sheet_name, sheet_data, sheet_path),
+                        self.formatting_func,
+                        fast=self.fast,
+                    ): sheet_name
+                    for sheet_name, (sheet_data, sheet_path) in jobs.items()
+                }
+                for future in as_completed(futures):
+                    future.result()
+        except ExportError:
+            raise
+        except Exception as e:
+            error_msg = f"Failed to export sheets next to {output_path}: {e}"
+            logger.exception(error_msg)
+            raise ExportError(error_msg) from e
+
+        return [sheet_path for _, sheet_path in jobs.values()]
+
     def export(self, data_frame: pd.DataFrame, output_path: str) -> str:
         """Export a single DataFrame to an Excel file.
 
@@ -226,56 +487,215 @@ class MultiSheetExcelExporter(Exporter):
         return self.export_multiple({"Data": data_frame}, output_path)
 
 
-def apply_excel_formatting(writer: any, sheet_name: str) -> None:  # noqa: C901
+class AsyncExporterPool:
+    """Collects rendered workbooks and writes them to disk concurrently.
+
+    Workbooks are serialized in memory as they are added; ``flush`` then
+    issues all file writes at once on worker threads, so disk I/O for many
+    outputs overlaps instead of running one file at a time.
+    """
+
+    def __init__(self, exporter: ExcelExporter | None = None) -> None:
+        """Initialize the exporter pool.
+
+        Args:
+            exporter: Exporter used to render each workbook
+        """
+        self.exporter = exporter or ExcelExporter()
+        self._pending: list[tuple[str, bytes]] = []
+
+    def add(self, data_frame: pd.DataFrame, output_path: str) -> None:
+        """Render a DataFrame and queue it for writing.
+
+        Args:
+            data_frame: DataFrame to export
+            output_path: Path to save the Excel file
+
+        Raises:
+            ExportError: If the data cannot be serialized
+        """
+        if data_frame.empty:
+            logger.info("Skipping empty export for %s", output_path)
+            return
+        self._pending.append((output_path, self.exporter.render(data_frame)))
+
+    def flush(self) -> list[str]:
+        """Write all queued workbooks to disk.
+
+        Returns:
+            List of paths that were written
+
+        Raises:
+            ExportError: If any file cannot be written
+        """
+        pending, self._pending = self._pending, []
+        logger.info("Writing %d workbooks", len(pending))
+        try:
+            asyncio.run(_write_all(pending))
+        except OSError as e:
+            error_msg = f"Failed to write exported workbooks: {e}"
+            logger.exception(error_msg)
+            raise ExportError(error_msg) from e
+        return [output_path for output_path, _ in pending]
+
+
+async def _write_all(pending: list[tuple[str, bytes]]) -> None:
+    """Write every (path, contents) pair concurrently.
+
+    Args:
+        pending: List of (output_path, workbook_bytes) tuples
+    """
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(_write_bytes, output_path, data)
+            for output_path, data in pending
+        ),
+    )
+
+
+def _write_bytes(output_path: str, data: bytes) -> None:
+    """Write bytes to a file, creating its directory if needed.
+
+    Args:
+        output_path: Path of the file to write
+        data: File contents
+    """
+    output_path_obj = Path(output_path)
+    output_path_obj.parent.mkdir(parents=True, exist_ok=True)
+    output_path_obj.write_bytes(data)
+
+
+def _export_sheet_worker(
+    job: tuple[str, pd.DataFrame, str],
+    formatting_func: Callable[[any, str, pd.DataFrame], None] | None,
+    *,
+    fast: bool,
+) -> str:
+    """Worker function to export one sheet into its own workbook.
+
+    Args:
+        job: Tuple of (sheet_name, data_frame, output_path)
+        formatting_func: Optional function to apply Excel formatting
+        fast: Whether the Rust-backed writer may be used
+
+    Returns:
+        Path to the exported file
+    """
+    sheet_name, data_frame, output_path = job
+    exporter = ExcelExporter(
+        sheet_name=sheet_name,
+        formatting_func=formatting_func,
+        fast=fast,
+    )
+    return exporter.export(data_frame, output_path)
+
+
+def _frame_column_widths(df: pd.DataFrame) -> list[int]:
+    """Compute column widths from the DataFrame with vectorized string lengths.
+
+    Args:
+        df: DataFrame that was written to the sheet
+
+    Returns:
+        Width for each column, in column order
+    """
+    widths = []
+    for position, column in enumerate(df.columns):
+        lengths = df.iloc[:, position].astype(str).str.len()
+        longest = int(lengths.max()) if len(lengths) else 0
+        widths.append(max(len(str(column)), longest) + 2)
+    return widths
+
+
+def _scan_column_widths(worksheet: any) -> list[int]:
+    """Compute column widths by scanning every cell of the worksheet.
+
+    Args:
+        worksheet: openpyxl worksheet to measure
+
+    Returns:
+        Width for each column, in column order
+    """
+    widths = []
+    for column in worksheet.columns:
+        max_length = 0
+        for cell in column:
+            if cell.value:
+                try:
+                    max_length = max(max_length, len(str(cell.value)))
+                except TypeError:
+                    ...
+        widths.append(max_length + 2)
+    return widths
+
+
+def apply_excel_formatting(
+    writer: any,
+    sheet_name: str,
+    df: pd.DataFrame | None = None,
+) -> None:
     """Apply standard Excel formatting to a worksheet.
 
     Args:
         writer: ExcelWriter object
         sheet_name: Name of the sheet to format
+        df: DataFrame written to the sheet; when given, column widths are
+            computed from it instead of scanning every cell
     """
     try:
         # Get the openpyxl workbook and worksheet
         worksheet = writer.sheets[sheet_name]
 
-        # Define styles
-        header_font = Font(bold=True)
-        header_fill = PatternFill(
-            start_color="D9E1F2",
-            end_color="D9E1F2",
-            fill_type="solid",
-        )
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
+        # Register the header style once per workbook
+        if _HEADER_STYLE_NAME not in writer.book.named_styles:
+            writer.book.add_named_style(
+                NamedStyle(
+                    _HEADER_STYLE_NAME,
+                    font=_HEADER_FONT,
+                    fill=_HEADER_FILL,
+                    border=_THIN_BORDER,
+                    alignment=_HEADER_ALIGN,
+                ),
+            )
 
         # Format headers - make them bold with light blue background
         for cell in worksheet[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+            cell.style = _HEADER_STYLE_NAME
 
         # Auto-adjust column widths
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
+        widths = (
+            _scan_column_widths(worksheet) if df is None else _frame_column_widths(df)
+        )
+        for index, width in enumerate(widths, start=1):
+            worksheet.column_dimensions[get_column_letter(index)].width = width
 
-            for cell in column:
-                if cell.value:
-                    try:
-                        cell_length = len(str(cell.value))
-                        max_length = max(max_length, cell_length)
-                    except TypeError:
-                        ...
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Failed to apply Excel formatting: %s", e)
 
-            adjusted_width = max_length + 2
-            worksheet.column_dimensions[column_letter].width = adjusted_width
 
-    except Exception as e:  # noqa: BLE001
-        logger.warning(f"Failed to apply Excel formatting: {e}")
+@functools.lru_cache(maxsize=1)
+def _run_timestamp() -> str:
+    """Get the timestamp shared by all outputs of this process.
+
+    Returns:
+        Timestamp formatted as YYYYMMDD_HHMMSS (UTC)
+    """
+    return datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S")
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_output_dir(output_dir: str) -> Path:
+    """Create an output directory once per process.
+
+    Args:
+        output_dir: Directory for output files
+
+    Returns:
+        Path of the directory
+    """
+    output_path_obj = Path(output_dir)
+    output_path_obj.mkdir(parents=True, exist_ok=True)
+    return output_path_obj
 
 
 def generate_output_filename(
@@ -285,6 +705,8 @@ def generate_output_filename(
 ) -> str:
     """Generate an output filename based on the input path.
 
+    All files generated by one process share the same run timestamp.
+
     Args:
         input_path: Path to the input file
         output_dir: Directory for output files
@@ -294,16 +716,12 @@ def generate_output_filename(
         Generated output path
     """
     # Create output directory if it doesn't exist
-    output_path_obj = Path(output_dir)
-    output_path_obj.mkdir(parents=True, exist_ok=True)
+    output_path_obj = _ensure_output_dir(str(output_dir))
 
     # Get the base filename without extension
     input_path_obj = Path(input_path)
     base_name = input_path_obj.stem
 
-    # Add timestamp
-    timestamp = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S")
-
     # Create output path
-    output_filename = f"{base_name}{suffix}_{timestamp}.xlsx"
+    output_filename = f"{base_name}{suffix}_{_run_timestamp()}.xlsx"
     return str(output_path_obj / output_filename)
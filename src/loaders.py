@@ -1,12 +1,37 @@
 """File loading module for Excel and CSV data sources."""
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
 
+import numpy as np
+import openpyxl
 import pandas as pd
 
+from src.utils.concurrency import is_picklable
 from src.utils.exceptions import FileLoadError
 from src.utils.logging import get_logger
 
+try:
+    import python_calamine  # noqa: F401
+
+    _EXCEL_ENGINE = "calamine"
+except ImportError:  # pragma: no cover - optional dependency
+    _EXCEL_ENGINE = None
+
+try:
+    import pyarrow as pa
+
+    _CSV_ENGINE = "pyarrow"
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    _CSV_ENGINE = None
+
+# Above this share of valid rows, invalid rows are dropped in place
+_IN_PLACE_DROP_RATIO = 0.9
+
+# Formats openpyxl can open in read-only mode
+_OPENPYXL_SUFFIXES = (".xlsx", ".xlsm")
+
 logger = get_logger(__name__)
 
 
@@ -20,6 +45,8 @@ class DataLoader:
             validation_rules: Dictionary of column names and validation functions
         """
         self.validation_rules = validation_rules or {}
+        required = self.validation_rules.get("required_columns")
+        self._required = frozenset(required) if required is not None else None
 
     def load(self, file_path: str) -> pd.DataFrame:
         """Load data from a file and validate it.
@@ -39,7 +66,8 @@ class DataLoader:
         """Validate the loaded data.
 
         Args:
-            df: DataFrame to validate
+            df: DataFrame to validate; a few invalid rows may be dropped from it
+                in place
 
         Returns:
             Tuple of (valid_data, validation_messages)
@@ -47,15 +75,15 @@ class DataLoader:
         validation_messages = []
 
         # Check required columns
-        if "required_columns" in self.validation_rules:
-            missing = set(self.validation_rules["required_columns"]) - set(df.columns)
+        if self._required is not None:
+            missing = self._required.difference(df.columns)
             if missing:
                 msg = f"Missing required columns: {', '.join(missing)}"
                 validation_messages.append(msg)
                 logger.warning(msg)
 
         # Apply custom validation functions
-        valid_mask = pd.Series(True, index=df.index)
+        valid_mask = np.ones(len(df), dtype=bool)
 
         for column, validators in self.validation_rules.items():
             if column == "required_columns":
@@ -68,28 +96,54 @@ class DataLoader:
                 try:
                     result = validator(df[column])
                     if isinstance(result, pd.Series):
-                        invalid_rows = ~result
-                        if invalid_rows.any():
-                            count = invalid_rows.sum()
+                        passed = result.to_numpy(dtype=bool, na_value=False)
+                        if not passed.all():
+                            count = len(passed) - np.count_nonzero(passed)
                             msg = f"{count} rows failed validation for column {column}"
                             validation_messages.append(msg)
                             logger.warning(msg)
-                            valid_mask = valid_mask & ~invalid_rows
+                            np.logical_and(valid_mask, passed, out=valid_mask)
                 except Exception as e:
                     msg = f"Validation error in column {column}: {e!s}"
                     validation_messages.append(msg)
                     logger.error(msg)
 
-        valid_df = df[valid_mask].copy() if not valid_mask.all() else df
+        total_rows = len(df)
+        valid_df = _filter_rows(df, valid_mask)
 
-        if len(valid_df) < len(df):
-            msg = f"Filtered out {len(df) - len(valid_df)} invalid rows"
+        if len(valid_df) < total_rows:
+            msg = f"Filtered out {total_rows - len(valid_df)} invalid rows"
             validation_messages.append(msg)
             logger.warning(msg)
 
         return valid_df, validation_messages
 
 
+def _filter_rows(df: pd.DataFrame, valid_mask: np.ndarray) -> pd.DataFrame:
+    """Keep only the rows selected by the validation mask.
+
+    When only a few rows are rejected they are dropped from ``df`` in
+    place, which avoids materialising a second copy of the whole frame.
+    Selective masks still copy, since that moves fewer bytes.
+
+    Args:
+        df: DataFrame to filter (may be modified in place)
+        valid_mask: Boolean array, True for rows to keep
+
+    Returns:
+        DataFrame containing only the valid rows
+    """
+    if valid_mask.all():
+        return df
+
+    if df.index.is_unique and valid_mask.mean() > _IN_PLACE_DROP_RATIO:
+        bad_idx = np.flatnonzero(~valid_mask)
+        df.drop(index=df.index[bad_idx], inplace=True)  # noqa: PD002
+        return df
+
+    return df[valid_mask].copy()
+
+
 class ExcelLoader(DataLoader):
     """Loader for Excel files."""
 
@@ -116,22 +170,21 @@ class ExcelLoader(DataLoader):
             FileLoadError: If the file cannot be loaded
         """
         try:
-            logger.info(f"Loading Excel file: {file_path}")
-            df = pd.read_excel(file_path, sheet_name=self.sheet_name)
+            logger.info("Loading Excel file: %s", file_path)
+            df = self._read(file_path)
 
             # If multiple sheets were loaded, combine them
             if isinstance(df, dict):
-                combined = pd.concat(
-                    [sheet.assign(sheet=name) for name, sheet in df.items()],
-                    ignore_index=True,
-                )
+                combined = _combine_sheets(df)
                 logger.info(
-                    f"Combined {len(df)} sheets with {len(combined)} total rows",
+                    "Combined %d sheets with %d total rows",
+                    len(df),
+                    len(combined),
                 )
                 valid_df, messages = self.validate(combined)
                 return valid_df
 
-            logger.info(f"Loaded {len(df)} rows from {file_path}")
+            logger.info("Loaded %d rows from %s", len(df), file_path)
             valid_df, messages = self.validate(df)
             return valid_df
 
@@ -140,6 +193,93 @@ class ExcelLoader(DataLoader):
             logger.error(error_msg)
             raise FileLoadError(error_msg) from e
 
+    def _read(self, file_path: str) -> pd.DataFrame | dict:
+        """Read the configured sheet(s) with the fastest available reader.
+
+        Uses the Rust-backed calamine engine when installed, otherwise
+        streams rows from openpyxl in read-only mode so no per-cell objects
+        are kept for the whole workbook.
+
+        Args:
+            file_path: Path to Excel file
+
+        Returns:
+            DataFrame, or dict of DataFrames when several sheets are selected
+        """
+        if _EXCEL_ENGINE is not None:
+            return pd.read_excel(
+                file_path,
+                sheet_name=self.sheet_name,
+                engine=_EXCEL_ENGINE,
+            )
+
+        if Path(file_path).suffix.lower() not in _OPENPYXL_SUFFIXES:
+            return pd.read_excel(file_path, sheet_name=self.sheet_name)
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            if self.sheet_name is None or isinstance(self.sheet_name, list):
+                selected = self.sheet_name or workbook.sheetnames
+                return {
+                    name: _read_worksheet(workbook, name) for name in selected
+                }
+            return _read_worksheet(workbook, self.sheet_name)
+        finally:
+            workbook.close()
+
+
+def _combine_sheets(sheets: dict) -> pd.DataFrame:
+    """Concatenate sheets into one DataFrame with a ``sheet`` column.
+
+    With pyarrow, each sheet is converted to an Arrow table and the tables
+    are concatenated in chunks without copying, then converted back with
+    ``self_destruct`` so Arrow buffers are released as columns are built.
+    Without pyarrow, or for sheets Arrow cannot convert, pandas is used.
+
+    Args:
+        sheets: Dictionary mapping sheet names to DataFrames
+
+    Returns:
+        Combined DataFrame
+    """
+    if pa is not None:
+        try:
+            tables = [
+                pa.Table.from_pandas(sheet, preserve_index=False).append_column(
+                    "sheet",
+                    pa.array([name] * len(sheet)),
+                )
+                for name, sheet in sheets.items()
+            ]
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            logger.debug("Falling back to pandas concat for mixed-type sheets")
+        else:
+            combined = pa.concat_tables(tables, promote_options="default")
+            return combined.to_pandas(split_blocks=True, self_destruct=True)
+
+    return pd.concat(
+        [sheet.assign(sheet=name) for name, sheet in sheets.items()],
+        ignore_index=True,
+    )
+
+
+def _read_worksheet(workbook: openpyxl.Workbook, sheet: str | int) -> pd.DataFrame:
+    """Build a DataFrame from a read-only worksheet.
+
+    Args:
+        workbook: Workbook opened in read-only mode
+        sheet: Sheet name or zero-based sheet index
+
+    Returns:
+        DataFrame using the first row as the header
+    """
+    name = workbook.sheetnames[sheet] if isinstance(sheet, int) else sheet
+    rows = workbook[name].iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+    return pd.DataFrame.from_records(rows, columns=header)
+
 
 class CSVLoader(DataLoader):
     """Loader for CSV files."""
@@ -169,13 +309,14 @@ class CSVLoader(DataLoader):
             FileLoadError: If the file cannot be loaded
         """
         try:
-            logger.info(f"Loading CSV file: {file_path}")
+            logger.info("Loading CSV file: %s", file_path)
             df = pd.read_csv(
                 file_path,
                 delimiter=self.delimiter,
                 encoding=self.encoding,
+                **self._engine_options(),
             )
-            logger.info(f"Loaded {len(df)} rows from {file_path}")
+            logger.info("Loaded %d rows from %s", len(df), file_path)
             valid_df, messages = self.validate(df)
             return valid_df
 
@@ -184,34 +325,80 @@ class CSVLoader(DataLoader):
             logger.error(error_msg)
             raise FileLoadError(error_msg) from e
 
+    def _engine_options(self) -> dict:
+        """Select the CSV parser engine for this loader.
+
+        The multithreaded pyarrow engine is used when installed, returning
+        Arrow-backed columns. It only supports single-character delimiters,
+        so anything else goes through the default C engine, or the python
+        engine for multi-character (regex) delimiters.
+
+        Returns:
+            Keyword arguments for pd.read_csv
+        """
+        if len(self.delimiter) != 1:
+            return {"engine": "python"}
+        if _CSV_ENGINE is None:
+            return {}
+        return {"engine": _CSV_ENGINE, "dtype_backend": "pyarrow"}
+
+
+def _load_file(path: str, loader_factory) -> tuple[str, pd.DataFrame | Exception]:
+    """Worker function to load a single file.
+
+    Defined at module level so it can be sent to worker processes.
+
+    Args:
+        path: Path of the file to load
+        loader_factory: Function that returns a loader instance for a file path
+
+    Returns:
+        Tuple of (path, DataFrame or exception)
+    """
+    try:
+        loader = loader_factory(path)
+        return path, loader.load(path)
+    except Exception as e:
+        logger.error("Error loading %s: %s", path, e)
+        return path, e
+
 
 def load_files_concurrently(
     file_paths: list[str],
     loader_factory,
     max_workers: int = None,
+    *,
+    use_processes: bool = True,
 ) -> dict[str, pd.DataFrame | Exception]:
-    """Load multiple files concurrently using ThreadPoolExecutor.
+    """Load multiple files concurrently.
+
+    Parsing is mostly CPU-bound Python code that holds the GIL, so files
+    are loaded in worker processes by default. Threads are used when
+    ``use_processes`` is False or ``loader_factory`` cannot be pickled
+    (e.g. a locally defined function).
 
     Args:
         file_paths: List of file paths to load
         loader_factory: Function that returns a loader instance for a file path
-        max_workers: Maximum number of worker threads
+        max_workers: Maximum number of workers
+        use_processes: Whether to load files in separate processes
 
     Returns:
         Dictionary mapping file paths to DataFrames or exceptions
     """
     results = {}
 
-    def load_file(path):
-        try:
-            loader = loader_factory(path)
-            return path, loader.load(path)
-        except Exception as e:
-            logger.error(f"Error loading {path}: {e!s}")
-            return path, e
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(load_file, path): path for path in file_paths}
+    executor_cls = ThreadPoolExecutor
+    if use_processes and is_picklable(loader_factory):
+        executor_cls = ProcessPoolExecutor
+    elif use_processes:
+        logger.debug("Loader factory is not picklable, loading files in threads")
+
+    with executor_cls(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_load_file, path, loader_factory): path
+            for path in file_paths
+        }
 
         for future in as_completed(futures):
             path, result = future.result()
@@ -1,5 +1,6 @@
 """Main processor module for the Daily Excel Reports application."""
 
+import os
 from pathlib import Path
 
 import pandas as pd
@@ -166,10 +167,11 @@ class DataProcessor:
                 logger.error(error_msg)
 
         # Step 2: Transform all loaded DataFrames concurrently
+        transform_workers = self.config.get("concurrency.transformers")
         transformed_data = transform_dataframes_concurrently(
             loaded_data,
             self._create_transformation_pipeline,
-            max_workers=self.config.get("concurrency.transformers"),
+            max_workers=transform_workers or os.cpu_count(),
         )
 
         # Check for transformation errors
@@ -201,7 +203,7 @@ class DataProcessor:
         valid_data = {
             Path(path).stem: data_frame
             for path, data_frame in transformed_data.items()
-            if isinstance(data_frame, pd.DataFrame)
+            if isinstance(data_frame, pd.DataFrame) and not data_frame.empty
         }
 
         if valid_data:
@@ -243,6 +245,10 @@ class DataProcessor:
             if not isinstance(data_frame, pd.DataFrame):
                 continue
 
+            if data_frame.empty:
+                logger.info("Skipping export of empty result for %s", path)
+                continue
+
             try:
                 output_path = generate_output_filename(path, output_dir)
                 exporter = ExcelExporter(formatting_func=apply_excel_formatting)
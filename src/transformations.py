@@ -1,12 +1,18 @@
 """Data transformation module for processing DataFrames."""
 
+import os
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 import pandas as pd
 
+from src.utils.concurrency import is_picklable
 from src.utils.logging import get_logger
 
+# Intermediate frames share column buffers until a column is written, so
+# transformations can return new frames without defensive deep copies
+pd.set_option("mode.copy_on_write", True)
+
 logger = get_logger(__name__)
 
 
@@ -63,13 +69,13 @@ class ColumnTransformation(Transformation):
         Returns:
             Transformed DataFrame
         """
-        result = df.copy()
+        updates = {}
 
         for col in self.columns:
-            if col in result.columns:
+            if col in df.columns:
                 try:
                     logger.debug(f"Applying {self.name} to column {col}")
-                    result[col] = self.func(result[col])
+                    updates[col] = self.func(updates.get(col, df[col]))
                 except Exception as e:
                     msg = (
                         f"Error in transformation {self.name} on column {col}: {e!s}",
@@ -78,7 +84,8 @@ class ColumnTransformation(Transformation):
             else:
                 logger.warning(f"Column {col} not found for transformation {self.name}")
 
-        return result
+        # Only the replaced columns are new; the rest share the input buffers
+        return df.assign(**updates) if updates else df
 
 
 class RowTransformation(Transformation):
@@ -110,7 +117,8 @@ class RowTransformation(Transformation):
         Returns:
             Transformed DataFrame
         """
-        result = df.copy()
+        # Shallow copy: with copy-on-write, only blocks written below are copied
+        result = df.copy(deep=False)
 
         try:
             if self.filter_func is not None:
@@ -160,18 +168,123 @@ class ComputedColumnTransformation(Transformation):
         Returns:
             DataFrame with added columns
         """
-        result = df.copy()
+        result = df
 
         for col_name, compute_func in self.column_specs.items():
             try:
                 logger.debug(f"Computing column {col_name}")
-                result[col_name] = compute_func(result)
+                result = result.assign(**{col_name: compute_func(result)})
             except Exception:
                 logger.exception(f"Error computing column {col_name}")
 
         return result
 
 
+class FusedColumnTransformation(Transformation):
+    """Several column transformations on disjoint columns applied in one pass.
+
+    Built by ``TransformationPipeline.compile``; not meant to be created
+    directly.
+    """
+
+    def __init__(
+        self,
+        specs: dict[str, tuple[str, Callable[[pd.Series], pd.Series]]],
+    ) -> None:
+        """Initialize a fused column transformation.
+
+        Args:
+            specs: Dictionary mapping column names to the (name, func) of the
+                original transformation for that column
+        """
+        names = dict.fromkeys(name for name, _ in specs.values())
+        super().__init__(" + ".join(names))
+        self.specs = specs
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply every fused function to its column and assign them at once.
+
+        Args:
+            df: DataFrame to transform
+
+        Returns:
+            Transformed DataFrame
+        """
+        updates = {}
+
+        for col, (name, func) in self.specs.items():
+            if col in df.columns:
+                try:
+                    logger.debug(f"Applying {name} to column {col}")
+                    updates[col] = func(df[col])
+                except Exception as e:
+                    msg = (
+                        f"Error in transformation {name} on column {col}: {e!s}"
+                    )
+                    logger.exception(msg)
+            else:
+                logger.warning(f"Column {col} not found for transformation {name}")
+
+        return df.assign(**updates) if updates else df
+
+
+def _column_specs(
+    transformation: Transformation,
+) -> dict[str, tuple[str, Callable[[pd.Series], pd.Series]]] | None:
+    """Get the per-column functions of a fusable column transformation.
+
+    Args:
+        transformation: Transformation to inspect
+
+    Returns:
+        Dictionary of column specs, or None if it cannot be fused
+    """
+    if type(transformation) is FusedColumnTransformation:
+        return transformation.specs
+    if type(transformation) is not ColumnTransformation:
+        return None
+    if len(set(transformation.columns)) != len(transformation.columns):
+        return None
+    return {
+        col: (transformation.name, transformation.func)
+        for col in transformation.columns
+    }
+
+
+def _fuse(
+    previous: Transformation,
+    current: Transformation,
+) -> Transformation | None:
+    """Merge two consecutive transformations into one stage if possible.
+
+    Column transformations fuse when their columns are disjoint, and
+    computed column transformations when they add different columns.
+    Subclasses are never fused, since they may override ``transform``.
+
+    Args:
+        previous: Earlier transformation (possibly already fused)
+        current: Transformation that follows it
+
+    Returns:
+        Fused transformation, or None if the two must run separately
+    """
+    if type(previous) is type(current) is ComputedColumnTransformation:
+        if previous.column_specs.keys() & current.column_specs.keys():
+            return None
+        return ComputedColumnTransformation(
+            f"{previous.name} + {current.name}",
+            {**previous.column_specs, **current.column_specs},
+        )
+
+    previous_specs = _column_specs(previous)
+    current_specs = _column_specs(current)
+    if previous_specs is None or current_specs is None:
+        return None
+    if previous_specs.keys() & current_specs.keys():
+        return None
+    return FusedColumnTransformation({**previous_specs, **current_specs})
+
+
 class TransformationPipeline:
     """Pipeline of transformations to be applied in sequence."""
 
@@ -185,6 +298,7 @@ class TransformationPipeline:
             transformations: List of transformations to apply in order
         """
         self.transformations = transformations or []
+        self._compiled = None
 
     def add_transformation(self, transformation: Transformation) -> None:
         """Add a transformation to the pipeline.
@@ -193,19 +307,47 @@ class TransformationPipeline:
             transformation: Transformation to add
         """
         self.transformations.append(transformation)
+        self._compiled = None
+
+    def compile(self) -> list[Transformation]:
+        """Fuse consecutive compatible transformations into single stages.
+
+        Runs of column transformations on disjoint columns become one
+        ``FusedColumnTransformation`` that assigns all columns at once, and
+        consecutive computed column transformations are merged. Call again
+        after modifying ``transformations`` directly.
+
+        Returns:
+            List of stages that ``transform`` will apply
+        """
+        stages = []
+        for transformation in self.transformations:
+            fused = _fuse(stages[-1], transformation) if stages else None
+            if fused is None:
+                stages.append(transformation)
+            else:
+                stages[-1] = fused
+
+        self._compiled = stages
+        return stages
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply all transformations in sequence.
 
+        The pipeline is compiled on first use.
+
         Args:
             df: DataFrame to transform
 
         Returns:
             Transformed DataFrame
         """
-        result = df.copy()
+        stages = self._compiled
+        if stages is None:
+            stages = self.compile()
+        result = df
 
-        for transformation in self.transformations:
+        for transformation in stages:
             try:
                 logger.info(f"Applying transformation: {transformation.name}")
                 result = transformation.transform(result)
@@ -240,13 +382,21 @@ def transform_dataframes_concurrently(
     dataframes: dict[str, pd.DataFrame],
     pipeline_factory: Callable[[], TransformationPipeline],
     max_workers: int | None = None,
+    *,
+    executor_cls: type[Executor] = ProcessPoolExecutor,
 ) -> dict[str, pd.DataFrame | Exception]:
-    """Transform multiple DataFrames concurrently using ThreadPoolExecutor.
+    """Transform multiple DataFrames concurrently.
+
+    Pipelines are CPU-bound pandas code that mostly holds the GIL, so
+    DataFrames are transformed in worker processes by default. Threads are
+    used instead when ``pipeline_factory`` cannot be pickled (e.g. a locally
+    defined function).
 
     Args:
         dataframes: Dictionary mapping file paths to DataFrames
         pipeline_factory: Function that returns a TransformationPipeline
-        max_workers: Maximum number of worker threads
+        max_workers: Maximum number of workers (defaults to the CPU count)
+        executor_cls: Executor class used to run the workers
 
     Returns:
         Dictionary mapping file paths to transformed DataFrames or exceptions
@@ -254,23 +404,25 @@ def transform_dataframes_concurrently(
     results = {}
 
     # Filter out exceptions from input
-    valid_dataframes = {
-        path: df for path, df in dataframes.items() if not isinstance(df, Exception)
-    }
-
-    if valid_dataframes:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    _transform_df_worker,
-                    (path, df, pipeline_factory),
-                ): path
-                for path, df in valid_dataframes.items()
-            }
-
-            for future in as_completed(futures):
-                path, result = future.result()
-                results[path] = result
+    items = [
+        (path, df, pipeline_factory)
+        for path, df in dataframes.items()
+        if not isinstance(df, Exception)
+    ]
+
+    if items:
+        use_processes = executor_cls is ProcessPoolExecutor
+        if use_processes and not is_picklable(pipeline_factory):
+            logger.debug("Pipeline factory is not picklable, using threads")
+            executor_cls = ThreadPoolExecutor
+
+        workers = max_workers or os.cpu_count() or 1
+        # Batch items per task to cut inter-process round trips
+        chunksize = max(1, len(items) // (4 * workers))
+        with executor_cls(max_workers=workers) as executor:
+            results.update(
+                executor.map(_transform_df_worker, items, chunksize=chunksize),
+            )
 
     # Include any errors from input
 
@@ -1,5 +1,7 @@
 """Example transformations for the Daily Excel Reports application."""
 
+from functools import partial
+
 import numpy as np
 import pandas as pd
 
@@ -10,6 +12,59 @@ from .transformations import (
     TransformationPipeline,
 )
 
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _outlier_mask(values: np.ndarray, std_dev: float) -> int:
+        """Replace outliers in a float64 array with NaN, in place.
+
+        Mean and sample standard deviation skip NaNs, matching pandas.
+        fastmath is left off since it would drop the NaN checks.
+
+        Args:
+            values: Array to process (modified in place)
+            std_dev: Number of standard deviations to use as threshold
+
+        Returns:
+            Number of values replaced
+        """
+        n = values.shape[0]
+        total = 0.0
+        count = 0
+        for i in numba.prange(n):
+            if not np.isnan(values[i]):
+                total += values[i]
+                count += 1
+        mean = total / count if count > 0 else np.nan
+
+        squares = 0.0
+        for i in numba.prange(n):
+            if not np.isnan(values[i]):
+                squares += (values[i] - mean) ** 2
+        std = np.sqrt(squares / (count - 1)) if count > 1 else np.nan
+
+        threshold = std_dev * std
+        low = mean - threshold
+        high = mean + threshold
+        replaced = 0
+        for i in numba.prange(n):
+            value = values[i]
+            if not np.isnan(value) and not (value >= low and value <= high):
+                values[i] = np.nan
+                replaced += 1
+        return replaced
+
+    # Compile (or load from cache) now rather than on the first real column
+    _outlier_mask(np.zeros(2), 3.0)
+else:  # pragma: no cover - optional dependency
+    _outlier_mask = None
+
+
 # Column transformations
 
 
@@ -30,6 +85,9 @@ def clean_string(series: pd.Series) -> pd.Series:
 def remove_outliers(series: pd.Series, std_dev: float = 3.0) -> pd.Series:
     """Remove outliers beyond specified standard deviations from the mean.
 
+    Plain NumPy numeric columns go through a single compiled kernel when
+    numba is installed; other numeric dtypes use pandas.
+
     Args:
         series: Series to process
         std_dev: Number of standard deviations to use as threshold
@@ -37,12 +95,31 @@ def remove_outliers(series: pd.Series, std_dev: float = 3.0) -> pd.Series:
     Returns:
         Series with outliers replaced by NaN
     """
-    if pd.api.types.is_numeric_dtype(series):
-        mean = series.mean()
-        std = series.std()
-        threshold = std_dev * std
-        return series.where((series >= mean - threshold) & (series <= mean + threshold))
-    return series
+    if not pd.api.types.is_numeric_dtype(series):
+        return series
+
+    if _outlier_mask is not None and _is_numpy_numeric(series):
+        values = series.to_numpy(dtype=np.float64, copy=True)
+        if _outlier_mask(values, std_dev) == 0:
+            return series
+        return pd.Series(values, index=series.index, name=series.name)
+
+    mean = series.mean()
+    std = series.std()
+    threshold = std_dev * std
+    return series.where((series >= mean - threshold) & (series <= mean + threshold))
+
+
+def _is_numpy_numeric(series: pd.Series) -> bool:
+    """Check whether a Series is backed by a plain NumPy number array.
+
+    Args:
+        series: Series to check
+
+    Returns:
+        True for NumPy integer, unsigned and float dtypes
+    """
+    return isinstance(series.dtype, np.dtype) and series.dtype.kind in "fiu"
 
 
 def format_date(series: pd.Series, date_format: str = "%Y-%m-%d") -> pd.Series:
@@ -68,6 +145,18 @@ def format_date(series: pd.Series, date_format: str = "%Y-%m-%d") -> pd.Series:
 # Row transformations
 
 
+def keep_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Return selected rows unchanged.
+
+    Args:
+        df: DataFrame of selected rows
+
+    Returns:
+        The same DataFrame
+    """
+    return df
+
+
 def filter_incomplete_rows(df: pd.DataFrame) -> pd.Series:
     """Filter for rows with incomplete data.
 
@@ -187,6 +276,9 @@ def compute_year_quarter(df: pd.DataFrame, date_col: str) -> pd.Series:
 def create_financial_report_pipeline() -> TransformationPipeline:
     """Create a transformation pipeline for financial reports.
 
+    All stages use module-level functions so the pipeline can be pickled
+    and sent to worker processes.
+
     Returns:
         Configured TransformationPipeline
     """
@@ -206,7 +298,7 @@ def create_financial_report_pipeline() -> TransformationPipeline:
         ColumnTransformation(
             "Format Dates",
             ["Date", "TransactionDate"],
-            lambda s: format_date(s, "%Y-%m-%d"),
+            format_date,
         ),
     )
 
@@ -215,7 +307,7 @@ def create_financial_report_pipeline() -> TransformationPipeline:
         ColumnTransformation(
             "Remove Outliers",
             ["Amount", "Balance"],
-            lambda s: remove_outliers(s, 3.0),
+            remove_outliers,
         ),
     )
 
@@ -223,7 +315,7 @@ def create_financial_report_pipeline() -> TransformationPipeline:
     pipeline.add_transformation(
         RowTransformation(
             "Filter Incomplete",
-            lambda df: df,
+            keep_rows,
             filter_func=filter_incomplete_rows,
         ),
     )
@@ -233,12 +325,16 @@ def create_financial_report_pipeline() -> TransformationPipeline:
         ComputedColumnTransformation(
             "Add Computed Columns",
             {
-                "Amount_MA_3": lambda df: compute_moving_average(df, "Amount", 3),
-                "Balance_Change_Pct": lambda df: compute_percentage_change(
-                    df,
-                    "Balance",
+                "Amount_MA_3": partial(
+                    compute_moving_average,
+                    value_col="Amount",
+                    window=3,
+                ),
+                "Balance_Change_Pct": partial(
+                    compute_percentage_change,
+                    value_col="Balance",
                 ),
-                "YearQuarter": lambda df: compute_year_quarter(df, "Date"),
+                "YearQuarter": partial(compute_year_quarter, date_col="Date"),
             },
         ),
     )
@@ -10,3 +10,5 @@ from .exceptions import (
     ExportError,
     ConfigError,
 )
+from .validators import njit_validator
+from .concurrency import is_picklable
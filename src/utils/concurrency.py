@@ -0,0 +1,19 @@
+"""Helpers for running work in thread and process pools."""
+
+import pickle
+
+
+def is_picklable(obj: object) -> bool:
+    """Check whether an object can be sent to a worker process.
+
+    Args:
+        obj: Object to check
+
+    Returns:
+        True if the object can be pickled
+    """
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
@@ -2,6 +2,7 @@
 
 import os
 import logging
+import functools
 from datetime import datetime
 from typing import Optional
 
@@ -17,6 +18,7 @@ DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 _logger = None
 
 
+@functools.lru_cache(maxsize=1)
 def configure_logging(
     log_dir: str = "logs",
     console_level: int = DEFAULT_CONSOLE_LEVEL,
@@ -25,6 +27,9 @@ def configure_logging(
 ) -> None:
     """Configure global logging for the application.
 
+    Calls are cached by argument, so repeated in-process invocations with
+    the same settings return immediately.
+
     Args:
         log_dir: Directory to store log files
         console_level: Logging level for console output
@@ -0,0 +1,51 @@
+"""Helpers for writing fast column validators."""
+
+import functools
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+
+def njit_validator(
+    fn: Callable[[np.ndarray], np.ndarray],
+) -> Callable[[pd.Series], pd.Series]:
+    """Compile a numeric validator with numba and adapt it to DataLoader.
+
+    The wrapped function must take a 1-D float64 NumPy array and return a
+    boolean array of the same length (True = row is valid). It runs on the
+    Series' underlying buffer, so loops over elements compile to machine
+    code instead of executing as Python bytecode per row. Missing values
+    are passed as NaN.
+
+    Example:
+        @njit_validator
+        def non_negative(values):
+            out = np.empty(values.shape[0], dtype=np.bool_)
+            for i in range(values.shape[0]):
+                out[i] = values[i] >= 0
+            return out
+
+        CSVLoader(validation_rules={"Amount": [non_negative]})
+
+    Without numba installed the function is called uncompiled.
+
+    Args:
+        fn: Validator operating on a NumPy array
+
+    Returns:
+        Validator operating on a pandas Series
+    """
+    try:
+        import numba
+    except ImportError:  # pragma: no cover - optional dependency
+        compiled = fn
+    else:
+        compiled = numba.njit(cache=True)(fn)
+
+    @functools.wraps(fn)
+    def wrapper(series: pd.Series) -> pd.Series:
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return pd.Series(compiled(values), index=series.index)
+
+    return wrapper
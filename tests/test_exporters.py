@@ -0,0 +1,206 @@
+"""Tests for data exporters."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src import exporters
+from src.exporters import (
+    AsyncExporterPool,
+    CSVExporter,
+    ExcelExporter,
+    MultiSheetExcelExporter,
+    apply_excel_formatting,
+    generate_output_filename,
+)
+
+
+def test_excel_exporter(sample_df, temp_output_dir):
+    """Test ExcelExporter writing a single sheet."""
+    output_path = os.path.join(temp_output_dir, "report.xlsx")
+
+    result = ExcelExporter(sheet_name="Data").export(sample_df, output_path)
+
+    assert result == output_path
+    loaded = pd.read_excel(output_path, sheet_name="Data")
+    assert list(loaded.columns) == list(sample_df.columns)
+    assert len(loaded) == len(sample_df)
+
+
+def test_excel_exporter_openpyxl_fallback(sample_df, temp_output_dir):
+    """Test ExcelExporter with the fast writer disabled."""
+    output_path = os.path.join(temp_output_dir, "report.xlsx")
+
+    ExcelExporter(fast=False).export(sample_df, output_path)
+
+    loaded = pd.read_excel(output_path)
+    assert len(loaded) == len(sample_df)
+
+
+def test_excel_exporter_with_formatting(sample_df, temp_output_dir):
+    """Test ExcelExporter applying formatting via openpyxl."""
+    output_path = os.path.join(temp_output_dir, "report.xlsx")
+
+    ExcelExporter(formatting_func=apply_excel_formatting).export(
+        sample_df, output_path
+    )
+
+    loaded = pd.read_excel(output_path)
+    assert len(loaded) == len(sample_df)
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_multi_sheet_excel_exporter(sample_df, temp_output_dir, fast):
+    """Test MultiSheetExcelExporter writing several sheets."""
+    output_path = os.path.join(temp_output_dir, "combined.xlsx")
+    dataframes = {"First": sample_df, "Second": sample_df.head(2)}
+
+    MultiSheetExcelExporter(fast=fast).export_multiple(dataframes, output_path)
+
+    loaded = pd.read_excel(output_path, sheet_name=None)
+    assert list(loaded) == ["First", "Second"]
+    assert len(loaded["Second"]) == 2
+
+
+def test_multi_sheet_write_only_round_trip(sample_df, temp_output_dir):
+    """Test that the write-only path keeps values and blanks missing ones."""
+    output_path = os.path.join(temp_output_dir, "combined.xlsx")
+    data = sample_df.assign(value=[1.5, None, 3.0, None, 5.0])
+
+    MultiSheetExcelExporter(fast=False).export_multiple({"Data": data}, output_path)
+
+    loaded = pd.read_excel(output_path, sheet_name="Data")
+    pd.testing.assert_frame_equal(loaded, data, check_dtype=False)
+
+
+def test_fast_writer_selection(monkeypatch):
+    """Test that formatting or a missing backend disables the fast writer."""
+    monkeypatch.setattr(exporters, "FastExcel", object())
+    assert exporters._use_fast_writer(fast=True, formatting_func=None)
+    assert not exporters._use_fast_writer(fast=False, formatting_func=None)
+    assert not exporters._use_fast_writer(
+        fast=True, formatting_func=apply_excel_formatting
+    )
+
+    monkeypatch.setattr(exporters, "FastExcel", None)
+    assert not exporters._use_fast_writer(fast=True, formatting_func=None)
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+def test_csv_exporter(sample_df, temp_output_dir, encoding):
+    """Test CSVExporter with Arrow-compatible and legacy encodings."""
+    output_path = os.path.join(temp_output_dir, "report.csv")
+
+    CSVExporter(delimiter=";", encoding=encoding).export(sample_df, output_path)
+
+    loaded = pd.read_csv(output_path, sep=";", encoding=encoding)
+    assert list(loaded.columns) == list(sample_df.columns)
+    assert loaded["value"].tolist() == sample_df["value"].tolist()
+
+
+def test_multi_sheet_export_separate(sample_df, temp_output_dir):
+    """Test exporting each sheet to its own file in worker processes."""
+    output_path = os.path.join(temp_output_dir, "combined.xlsx")
+    dataframes = {"First": sample_df, "Second": sample_df.head(2)}
+
+    exporter = MultiSheetExcelExporter(formatting_func=apply_excel_formatting)
+    paths = exporter.export_separate(dataframes, output_path, max_workers=2)
+
+    assert [os.path.basename(p) for p in paths] == [
+        "combined_First.xlsx",
+        "combined_Second.xlsx",
+    ]
+    assert len(pd.read_excel(paths[0], sheet_name="First")) == len(sample_df)
+    assert len(pd.read_excel(paths[1], sheet_name="Second")) == 2
+
+
+def test_apply_excel_formatting_header_style(sample_df, temp_output_dir):
+    """Test that formatted headers share one named style."""
+    import openpyxl
+
+    output_path = os.path.join(temp_output_dir, "combined.xlsx")
+    dataframes = {"First": sample_df, "Second": sample_df}
+
+    MultiSheetExcelExporter(formatting_func=apply_excel_formatting).export_multiple(
+        dataframes, output_path
+    )
+
+    workbook = openpyxl.load_workbook(output_path)
+    assert "DailyReportHeader" in workbook.named_styles
+    for worksheet in workbook.worksheets:
+        header = worksheet["A1"]
+        assert header.style == "DailyReportHeader"
+        assert header.font.bold
+        assert header.fill.start_color.rgb.endswith("D9E1F2")
+
+
+def test_apply_excel_formatting_column_widths(temp_output_dir):
+    """Test that column widths are computed from the exported DataFrame."""
+    import openpyxl
+
+    output_path = os.path.join(temp_output_dir, "report.xlsx")
+    df = pd.DataFrame({"id": [1, 2], "description": ["short", "a much longer text"]})
+
+    ExcelExporter(formatting_func=apply_excel_formatting).export(df, output_path)
+
+    worksheet = openpyxl.load_workbook(output_path)["Data"]
+    assert worksheet.column_dimensions["A"].width == len("id") + 2
+    assert worksheet.column_dimensions["B"].width == len("a much longer text") + 2
+
+
+def test_empty_exports_skip_writing(temp_output_dir):
+    """Test that empty DataFrames do not produce workbooks."""
+    empty = pd.DataFrame({"col1": []})
+    single_path = os.path.join(temp_output_dir, "single.xlsx")
+    multi_path = os.path.join(temp_output_dir, "multi.xlsx")
+
+    assert ExcelExporter().export(empty, single_path) == single_path
+    assert MultiSheetExcelExporter().export_multiple({"A": empty}, multi_path) == (
+        multi_path
+    )
+
+    assert not os.path.exists(single_path)
+    assert not os.path.exists(multi_path)
+
+
+def test_multi_sheet_export_drops_empty_sheets(sample_df, temp_output_dir):
+    """Test that empty sheets are left out of a multi-sheet workbook."""
+    output_path = os.path.join(temp_output_dir, "combined.xlsx")
+    dataframes = {"Data": sample_df, "Empty": sample_df.iloc[0:0]}
+
+    MultiSheetExcelExporter().export_multiple(dataframes, output_path)
+
+    assert list(pd.read_excel(output_path, sheet_name=None)) == ["Data"]
+
+
+@pytest.mark.parametrize("formatting_func", [None, apply_excel_formatting])
+def test_async_exporter_pool(sample_df, temp_output_dir, formatting_func):
+    """Test rendering workbooks in memory and flushing them together."""
+    pool = AsyncExporterPool(ExcelExporter(formatting_func=formatting_func))
+    paths = [
+        os.path.join(temp_output_dir, "nested", f"report_{i}.xlsx") for i in range(3)
+    ]
+
+    for path in paths:
+        pool.add(sample_df, path)
+    pool.add(sample_df.iloc[0:0], os.path.join(temp_output_dir, "empty.xlsx"))
+
+    assert pool.flush() == paths
+    for path in paths:
+        assert len(pd.read_excel(path)) == len(sample_df)
+    assert not os.path.exists(os.path.join(temp_output_dir, "empty.xlsx"))
+    assert pool.flush() == []
+
+
+def test_generate_output_filename_shares_run_timestamp(temp_output_dir):
+    """Test that outputs of one run share a timestamp and directory."""
+    output_dir = os.path.join(temp_output_dir, "out")
+
+    first = generate_output_filename("data/a.xlsx", output_dir)
+    second = generate_output_filename("reports/b.csv", output_dir)
+
+    assert os.path.isdir(output_dir)
+    assert os.path.dirname(first) == output_dir
+    assert first.rsplit("_processed_", 1)[1] == second.rsplit("_processed_", 1)[1]
+    assert os.path.basename(second).startswith("b_processed_")
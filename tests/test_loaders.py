@@ -205,3 +205,129 @@ def test_loader_file_not_found():
 
     with pytest.raises(FileLoadError):
         excel_loader.load("non_existent_file.xlsx")
+
+
+def test_excel_loader_openpyxl_read_only(monkeypatch):
+    """Test ExcelLoader reading through openpyxl when calamine is missing."""
+    import src.loaders
+
+    monkeypatch.setattr(src.loaders, "_EXCEL_ENGINE", None)
+
+    data1 = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    data2 = pd.DataFrame({"col3": [4, 5], "col4": ["d", "e"]})
+
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp:
+        with pd.ExcelWriter(temp.name) as writer:
+            data1.to_excel(writer, sheet_name="Sheet1", index=False)
+            data2.to_excel(writer, sheet_name="Sheet2", index=False)
+        temp_path = temp.name
+
+    try:
+        # Load first sheet by index
+        result = ExcelLoader().load(temp_path)
+        pd.testing.assert_frame_equal(result, data1)
+
+        # Load all sheets
+        combined = ExcelLoader(sheet_name=None).load(temp_path)
+        assert len(combined) == 5
+        assert set(combined["sheet"]) == {"Sheet1", "Sheet2"}
+    finally:
+        os.unlink(temp_path)
+
+
+def _csv_loader_factory(path):
+    """Module-level loader factory so it can be pickled for worker processes."""
+    return CSVLoader()
+
+
+@pytest.mark.parametrize("use_processes", [True, False])
+def test_load_files_concurrently_executors(use_processes):
+    """Test loading files with process and thread executors."""
+    data = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as temp:
+        data.to_csv(temp.name, index=False)
+        temp_path = temp.name
+
+    try:
+        results = load_files_concurrently(
+            [temp_path, "non_existent_file.csv"],
+            _csv_loader_factory,
+            max_workers=2,
+            use_processes=use_processes,
+        )
+
+        pd.testing.assert_frame_equal(results[temp_path], data, check_dtype=False)
+        assert isinstance(results["non_existent_file.csv"], FileLoadError)
+    finally:
+        os.unlink(temp_path)
+
+
+@pytest.mark.parametrize("delimiter", [";", "::"])
+def test_csv_loader_delimiters(delimiter):
+    """Test CSVLoader with pyarrow-compatible and multi-character delimiters."""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as temp:
+        temp.write(f"col1{delimiter}col2\n1{delimiter}a\n2{delimiter}b\n")
+        temp_path = temp.name
+
+    try:
+        result = CSVLoader(delimiter=delimiter).load(temp_path)
+
+        assert list(result.columns) == ["col1", "col2"]
+        assert result["col1"].tolist() == [1, 2]
+        assert result["col2"].tolist() == ["a", "b"]
+    finally:
+        os.unlink(temp_path)
+
+
+@pytest.mark.parametrize("n_invalid", [1, 6])
+def test_data_loader_validate_filters_rows(n_invalid):
+    """Test row filtering for both in-place drop and copy paths."""
+    df = pd.DataFrame({"col1": range(20)})
+    loader = DataLoader(validation_rules={"col1": [lambda s: s >= n_invalid]})
+
+    valid_df, messages = loader.validate(df)
+
+    assert valid_df["col1"].tolist() == list(range(n_invalid, 20))
+    assert f"Filtered out {n_invalid} invalid rows" in messages
+
+
+def test_combine_sheets_matches_pandas(monkeypatch):
+    """Test that the Arrow sheet concat matches the pandas fallback."""
+    import src.loaders
+
+    sheets = {
+        "Sheet1": pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}),
+        "Sheet2": pd.DataFrame({"col1": [3], "col2": ["c"], "col3": [1.5]}),
+    }
+
+    arrow_result = src.loaders._combine_sheets(sheets)
+    monkeypatch.setattr(src.loaders, "pa", None)
+    pandas_result = src.loaders._combine_sheets(sheets)
+
+    pd.testing.assert_frame_equal(
+        arrow_result[sorted(arrow_result.columns)],
+        pandas_result[sorted(pandas_result.columns)],
+    )
+
+
+def test_njit_validator():
+    """Test a numba-compiled validator filtering rows in DataLoader."""
+    import numpy as np
+
+    from src.utils.validators import njit_validator
+
+    @njit_validator
+    def non_negative(values):
+        out = np.empty(values.shape[0], dtype=np.bool_)
+        for i in range(values.shape[0]):
+            out[i] = values[i] >= 0
+        return out
+
+    df = pd.DataFrame({"amount": [1.0, -2.0, 3.0, None]}, index=[10, 11, 12, 13])
+    loader = DataLoader(validation_rules={"amount": [non_negative]})
+
+    valid_df, messages = loader.validate(df)
+
+    assert valid_df.index.tolist() == [10, 12]
+    assert "2 rows failed validation for column amount" in messages
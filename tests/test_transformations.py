@@ -0,0 +1,163 @@
+"""Tests for data transformations."""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.transformations import (
+    ColumnTransformation,
+    ComputedColumnTransformation,
+    FusedColumnTransformation,
+    RowTransformation,
+    TransformationPipeline,
+    transform_dataframes_concurrently,
+)
+from src import transformations_examples
+from src.transformations_examples import (
+    create_financial_report_pipeline,
+    remove_outliers,
+)
+
+
+def test_column_transformation_shares_untouched_columns(sample_df):
+    """Test that untouched columns are not copied by a column transformation."""
+    transformation = ColumnTransformation("Double", ["value"], lambda s: s * 2)
+
+    result = transformation.transform(sample_df)
+
+    assert result["value"].tolist() == [20, 40, 60, 80, 100]
+    assert sample_df["value"].tolist() == [10, 20, 30, 40, 50]
+    assert np.shares_memory(
+        sample_df["date"].to_numpy(), result["date"].to_numpy()
+    )
+
+
+def test_row_transformation_with_filter_leaves_input_unchanged(sample_df):
+    """Test that masked row updates do not leak into the input frame."""
+    transformation = RowTransformation(
+        "Zero Large",
+        lambda df: df.assign(value=0),
+        filter_func=lambda df: df["value"] > 30,
+    )
+
+    result = transformation.transform(sample_df)
+
+    assert result["value"].tolist() == [10, 20, 30, 0, 0]
+    assert sample_df["value"].tolist() == [10, 20, 30, 40, 50]
+
+
+def test_pipeline_adds_computed_columns_without_mutating_input(sample_df):
+    """Test a pipeline end to end against the original frame."""
+    pipeline = TransformationPipeline(
+        [
+            ColumnTransformation("Lower", ["category"], lambda s: s.str.lower()),
+            ComputedColumnTransformation(
+                "Computed",
+                {
+                    "double": lambda df: df["value"] * 2,
+                    "quad": lambda df: df["double"] * 2,
+                },
+            ),
+        ],
+    )
+
+    result = pipeline.transform(sample_df)
+
+    assert result["quad"].tolist() == [40, 80, 120, 160, 200]
+    assert result["category"].tolist() == ["a", "b", "c", "d", "e"]
+    assert list(sample_df.columns) == ["date", "value", "category"]
+    assert np.shares_memory(
+        sample_df["value"].to_numpy(), result["value"].to_numpy()
+    )
+    pd.testing.assert_series_equal(
+        sample_df["category"], result["category"].str.upper()
+    )
+
+
+def test_pipeline_compile_fuses_disjoint_stages(sample_df):
+    """Test that compile fuses compatible stages without changing results."""
+    transformations = [
+        ColumnTransformation("Double", ["value"], lambda s: s * 2),
+        ColumnTransformation("Lower", ["category"], lambda s: s.str.lower()),
+        ColumnTransformation("Increment", ["value"], lambda s: s + 1),
+        ComputedColumnTransformation("A", {"a": lambda df: df["value"] + 1}),
+        ComputedColumnTransformation("B", {"b": lambda df: df["a"] * 2}),
+    ]
+    pipeline = TransformationPipeline(list(transformations))
+
+    stages = pipeline.compile()
+
+    assert [stage.name for stage in stages] == [
+        "Double + Lower",
+        "Increment",
+        "A + B",
+    ]
+    assert isinstance(stages[0], FusedColumnTransformation)
+
+    expected = sample_df
+    for transformation in transformations:
+        expected = transformation.transform(expected)
+    pd.testing.assert_frame_equal(pipeline.transform(sample_df), expected)
+
+
+def test_pipeline_recompiles_after_adding_transformation(sample_df):
+    """Test that adding a stage invalidates the compiled pipeline."""
+    pipeline = TransformationPipeline()
+    pipeline.transform(sample_df)
+
+    pipeline.add_transformation(
+        ColumnTransformation("Double", ["value"], lambda s: s * 2),
+    )
+
+    assert pipeline.transform(sample_df)["value"].tolist() == [20, 40, 60, 80, 100]
+
+
+@pytest.mark.parametrize("executor_cls", [ProcessPoolExecutor, ThreadPoolExecutor])
+def test_transform_dataframes_concurrently(sample_df, executor_cls):
+    """Test transforming several DataFrames in processes and threads."""
+    dataframes = {
+        "a.xlsx": sample_df,
+        "b.xlsx": sample_df.head(2),
+        "c.xlsx": Exception("load failed"),
+    }
+
+    results = transform_dataframes_concurrently(
+        dataframes,
+        create_financial_report_pipeline,
+        max_workers=2,
+        executor_cls=executor_cls,
+    )
+
+    assert set(results) == set(dataframes)
+    assert "YearQuarter" in results["a.xlsx"].columns
+    assert len(results["b.xlsx"]) == 2
+    assert results["c.xlsx"] is dataframes["c.xlsx"]
+
+
+def test_financial_report_pipeline_is_picklable():
+    """Test that the example pipeline can be sent to worker processes."""
+    pipeline = pickle.loads(pickle.dumps(create_financial_report_pipeline()))
+
+    assert len(pipeline.transformations) == 5
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1.0, 2.0, np.nan, 3.0, 2.5, 1.5] * 5 + [1000.0],
+        [10, 20, 30, 40, 50],
+        [5.0],
+    ],
+)
+def test_remove_outliers_matches_pandas(monkeypatch, values):
+    """Test the compiled outlier kernel against the pandas implementation."""
+    series = pd.Series(values, name="Amount")
+
+    result = remove_outliers(series, 2.0)
+    monkeypatch.setattr(transformations_examples, "_outlier_mask", None)
+    expected = remove_outliers(series, 2.0)
+
+    pd.testing.assert_series_equal(result, expected)